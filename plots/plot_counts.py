@@ -1,5 +1,104 @@
+import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# dtype of percentage labels; None lets pandas infer its default string dtype
+# (on pandas 3 and later, "str" backed by pyarrow if it is installed)
+_PERCENT_DTYPE = None
+if int(pd.__version__.split(".")[0]) < 3:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        # Compact storage for the many short, repeated percentage labels
+        _PERCENT_DTYPE = "string[pyarrow]"
+
+
+# Labels indexed by percentage class codes (3 - formatted value)
+_PERCENT_LABELS = np.array(["0%", "<0.1%", ">99.9%", ""], dtype=object)
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _classify(pct, codes):
+        """Write percentage class codes (see `_PERCENT_LABELS`) to `codes`."""
+        for k in range(pct.shape[0]):
+            i = pct[k]
+            if i == 0:
+                codes[k] = 0
+            elif i < 0.1:
+                codes[k] = 1
+            elif 99.9 < i < 100:
+                codes[k] = 2
+            else:
+                codes[k] = 3
+
+else:
+    _classify = None
+
+
+def _format_percent_array(values):
+    """Express counts as percentage labels (see `counts_to_percentages`).
+
+    Args:
+        values (numpy.ndarray): Counts data.
+
+    Returns:
+        numpy.ndarray of object dtype with percentage labels as str.
+    """
+    x_sum = float(np.nansum(values))
+    if len(values) < 256 and x_sum != 0:
+        # Small inputs (typical frequency tables): a loop over Python floats
+        # is faster than the NumPy machinery below. A zero total is left to
+        # NumPy, which gives "nan%" instead of raising ZeroDivisionError
+        fmt = "%.1f%%".__mod__
+        lab_0, lab_lo, lab_hi = "0%", "<0.1%", ">99.9%"
+        # Values that would be formatted as "0.0%" (i < 0.05) get `lab_lo`
+        out = [
+            lab_0
+            if i == 0
+            else lab_lo
+            if i < 0.1
+            else lab_hi
+            if 99.9 < i < 100
+            else fmt(i)
+            for i in (v / x_sum * 100 for v in values.tolist())
+        ]
+        return np.array(out, dtype=object)
+
+    # Single division kernel into a new array, then scale it in place.
+    # A zero total is a valid input here and gives "nan%" / "inf%" silently
+    vals = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.divide(vals, x_sum)
+        pct *= 100.0
+
+    # Classify values (see `_PERCENT_LABELS`) without Python-level branching:
+    # large inputs in a compiled loop (if Numba is available), others with
+    # vectorized comparisons
+    if _classify is not None and len(pct) >= 10_000:
+        codes = np.empty(len(pct), dtype=np.int8)
+        _classify(pct, codes)
+    else:
+        codes = np.select(
+            [pct == 0, pct < 0.1, (pct > 99.9) & (pct < 100)],
+            [0, 1, 2],
+            default=3,
+        ).astype(np.int8)
+
+    out = _PERCENT_LABELS[codes]
+    m_mid = codes == 3
+    out[m_mid] = np.char.mod("%.1f%%", pct[m_mid])
+
+    return out
+
+
 def counts_to_percentages(x, name="percent"):
     """Express counts as percentages.
 
@@ -16,6 +115,9 @@ def counts_to_percentages(x, name="percent"):
              Values equal to 0 are formatted as "0%", values between
              0 and 0.1 are formatted as "<0.1%", values between 99.9 and 100
              are formatted as ">99.9%".
+             The dtype is the default string dtype of pandas ("str" on
+             pandas 3 and later). On older pandas versions, it is
+             "string[pyarrow]" if pyarrow is installed and object otherwise.
 
     Examples:
     >>> import pandas as pd
@@ -24,24 +126,9 @@ def counts_to_percentages(x, name="percent"):
     
     Author: Vilmantas Gėgžna
     """
-    x_sum = x.sum()
-    return (
-        pd.Series(
-            [
-                "0%"
-                if i == 0
-                else "<0.1%"
-                if i < 0.1
-                else ">99.9%"
-                if 99.9 < i < 100
-                else f"{i:.1f}%"
-                for i in (x / x_sum * 100)
-            ],
-            index=x.index,
-        )
-        .replace("0.0%", "<0.1%")
-        .rename(name)
-    )
+    out = _format_percent_array(x.to_numpy())
+    return pd.Series(out, index=x.index, name=name, dtype=_PERCENT_DTYPE)
+
 
 def calc_counts_and_percentages(
     group, data, sort=True, weight=None, n_label="n", perc_label="percent"
@@ -49,7 +136,8 @@ def calc_counts_and_percentages(
     """Create frequency table that contains counts and percentages.
 
     Args:
-        group (str): Variable that defines the groups. Column name from `data`.
+        group (str or list of str): Variable(s) that define the groups.
+             Column name(s) from `data`.
         data (pandas.DataFrame): data frame.
         sort (bool or "index", optional): Way to sort values:
              - True - sort by count descending.
@@ -61,7 +149,7 @@ def calc_counts_and_percentages(
         perc_label (str, optional): Name for output column with percentage.
 
     Return: pandas.DataFrame with 3 columns:
-            - column with unique values of `x`,
+            - column(s) with unique values of `group`,
             - column `n_label` (defaults to "n") with counts as int, and
             - column `perc_label` (defaults to "percent") with percentage
               values formatted as str.
@@ -73,20 +161,69 @@ def calc_counts_and_percentages(
 
     if weight is None:
         counts = data[group].value_counts(sort=vsort)
-        if sort == "index":
-            counts = counts.sort_index()
     else:
-        counts = data.groupby(group)[weight].sum()
-
-    percent = counts_to_percentages(counts)
-
-    return (
-        pd.concat([counts.rename(n_label), percent.rename(perc_label)], axis=1)
-        .rename_axis(group)
-        .reset_index()
+        counts = data.groupby(group, observed=True)[weight].sum()
+
+    idx = counts.index
+    n_vals = counts.to_numpy()
+    perc_vals = _format_percent_array(n_vals)
+    if _PERCENT_DTYPE is not None:
+        perc_vals = pd.array(perc_vals, dtype=_PERCENT_DTYPE)
+
+    if sort == "index":
+        order = idx.argsort()
+        idx = idx[order]
+        n_vals = n_vals[order]
+        perc_vals = perc_vals[order]
+
+    # List of grouping variables: one column per index level
+    if isinstance(group, list) or isinstance(idx, pd.MultiIndex):
+        freq_table = idx.to_frame(index=False)
+        freq_table[n_label] = n_vals
+        freq_table[perc_label] = perc_vals
+        return freq_table
+
+    return pd.DataFrame(
+        {group: idx.array, n_label: n_vals, perc_label: perc_vals}
     )
     
 # Plot counts ---------------------------------------------------------------
+
+# Options of pandas.DataFrame.plot.bar() that matplotlib.axes.Axes.bar() does
+# not accept; plot_counts_with_labels() applies them to the axes itself
+_AXES_PLOT_KWARGS = frozenset(
+    {"rot", "width", "figsize", "grid", "xlim", "ylim", "logy", "fontsize"}
+)
+
+# Other options of pandas.DataFrame.plot.bar() that are not supported by
+# plot_counts_with_labels()
+_UNSUPPORTED_PLOT_KWARGS = frozenset(
+    {
+        "kind",
+        "subplots",
+        "sharex",
+        "sharey",
+        "layout",
+        "use_index",
+        "style",
+        "logx",
+        "loglog",
+        "xticks",
+        "yticks",
+        "colormap",
+        "colorbar",
+        "position",
+        "table",
+        "stacked",
+        "sort_columns",
+        "secondary_y",
+        "mark_right",
+        "include_bool",
+        "backend",
+    }
+)
+
+
 def plot_counts_with_labels(
     counts,
     title="",
@@ -123,7 +260,17 @@ def plot_counts_with_labels(
         y_lim_max (float, optional): Upper limit for Y axis.
                 Defaults to None: do not change.
         ax (matplotlib.axes.Axes, optional): Axes object. Defaults to None.
-        **kwargs: further arguments to pandas.DataFrame.plot.bar()
+        **kwargs: further arguments to matplotlib.axes.Axes.bar().
+                Additionally, `rot` (defaults to 90), `width` (defaults to
+                0.5), `figsize`, `grid`, `xlim`, `ylim`, `logy` and `fontsize`
+                are accepted as in pandas.DataFrame.plot.bar(); as before,
+                `y_lim_max` takes precedence over `ylim`. Other
+                pandas.DataFrame.plot.bar() options (e.g., `colormap`,
+                `logx`, `xticks`, `secondary_y`) are not supported.
+
+    Raises:
+        TypeError: if an unsupported pandas.DataFrame.plot.bar() option is
+                passed in `**kwargs`.
 
     Returns:
         matplotlib.axes.Axes: Axes object of the generate plot.
@@ -136,27 +283,85 @@ def plot_counts_with_labels(
     if xlabel is None:
         xlabel = x.capitalize()
 
+    xs = counts[x].to_numpy()
+    ys = counts[y].to_numpy()
+    labs = counts[label].to_numpy()
+
     if y_lim_max is None:
-        y_lim_max = counts[y].max() * 1.15
+        y_lim_max = ys.max() * 1.15
 
-    ax = counts.plot.bar(x=x, y=y, legend=legend, ax=ax, ec=ec, **kwargs)
+    unsupported = sorted(_UNSUPPORTED_PLOT_KWARGS & kwargs.keys())
+    if unsupported:
+        raise TypeError(
+            "plot_counts_with_labels() does not support pandas plot "
+            f"option(s): {', '.join(unsupported)}"
+        )
+
+    # Split pandas-style options from arguments for Axes.bar()
+    plot_kwargs = {k: kwargs.pop(k) for k in _AXES_PLOT_KWARGS & kwargs.keys()}
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=plot_kwargs.get("figsize"))
+
+    pos = np.arange(len(xs))
+    width = plot_kwargs.get("width", 0.5)
+    ax.bar(
+        pos,
+        ys,
+        width=width,
+        edgecolor=ec,
+        label=y,
+        **kwargs,
+    )
+    ax.set_xticks(pos)
+    ax.set_xticklabels(xs, rotation=plot_kwargs.get("rot", 90))
+    if "fontsize" in plot_kwargs:
+        ax.tick_params(labelsize=plot_kwargs["fontsize"])
+    if plot_kwargs.get("logy"):
+        ax.set_yscale("log")
+    if "grid" in plot_kwargs:
+        ax.grid(plot_kwargs["grid"])
+    if legend:
+        ax.legend()
     ax.set_title(title, fontsize=title_fontsize)
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
-    ax_add_value_labels_ab(ax, labels=counts[label], rotation=label_rotation)
+    ax_add_value_labels_ab(
+        ax, labels=labs, x_positions=pos, heights=ys, rotation=label_rotation
+    )
+    if "ylim" in plot_kwargs:
+        ax.set_ylim(plot_kwargs["ylim"])
     ax.set_ylim(0, y_lim_max)
+    # Same x range as pandas.DataFrame.plot.bar(): no autoscale margins
+    ax.set_xlim(
+        plot_kwargs.get(
+            "xlim", (-0.25 - width / 2, len(xs) - 0.75 + width / 2)
+        )
+    )
 
     return ax
 
 
 def ax_add_value_labels_ab(
-    ax, labels=None, spacing=2, size=9, weight="bold", **kwargs
+    ax,
+    labels=None,
+    x_positions=None,
+    heights=None,
+    spacing=2,
+    size=9,
+    weight="bold",
+    **kwargs,
 ):
     """Add value labels above/below each bar in a bar chart.
 
     Arguments:
         ax (matplotlib.Axes): Plot (axes) to annotate.
-        label (str or similar): Values to be used as labels.
+        labels (array-like of str, optional): Values to be used as labels.
+             Defaults to None: bar heights with one decimal place.
+        x_positions (array-like of float, optional): X coordinates of bar
+             centers. Defaults to None: taken from `ax.patches`.
+        heights (array-like of float, optional): Bar heights.
+             Defaults to None: taken from `ax.patches`.
         spacing (int): Number of points between bar and label.
         size (int): font size.
         weight (str): font weight.
@@ -165,31 +370,35 @@ def ax_add_value_labels_ab(
     Source:
         This function is based on https://stackoverflow.com/a/48372659/4783029
     """
+    n = len(ax.patches)
+    if heights is None:
+        heights = np.fromiter(
+            (r.get_height() for r in ax.patches), dtype=float, count=n
+        )
+    else:
+        heights = np.asarray(heights, dtype=float)
 
-    # For each bar: Place a label
-    for rect, label in zip(ax.patches, labels):
-        # Get X and Y placement of label from rect.
-        y_value = rect.get_height()
-        x_value = rect.get_x() + rect.get_width() / 2
-
-        space = spacing
-
-        # Vertical alignment for positive values
-        va = "bottom"
+    if x_positions is None:
+        x_positions = np.fromiter(
+            (r.get_x() + r.get_width() / 2 for r in ax.patches),
+            dtype=float,
+            count=n,
+        )
 
-        # If the value of a bar is negative: Place label below the bar
-        if y_value < 0:
-            # Invert space to place label below
-            space *= -1
-            # Vertical alignment
-            va = "top"
+    # Use Y value as label and format number with one decimal place
+    if labels is None:
+        labels = ["{:.1f}".format(h) for h in heights]
 
-        # Use Y value as label and format number with one decimal place
-        if labels is None:
-            label = "{:.1f}".format(y_value)
+    # If the value of a bar is negative: Place label below the bar
+    spaces = np.where(heights < 0, -spacing, spacing)
+    vas = np.where(heights < 0, "top", "bottom")
 
-        # Create annotation
-        ax.annotate(
+    # For each bar: Place a label
+    annotate = ax.annotate
+    for x_value, y_value, space, va, label in zip(
+        x_positions, heights, spaces, vas, labels
+    ):
+        annotate(
             label,
             (x_value, y_value),
             xytext=(0, space),
@@ -200,7 +409,8 @@ def ax_add_value_labels_ab(
             fontweight=weight,
             **kwargs,
         )
-        
+
+
 def plot_crosstab_as_barplot(
     data: pd.DataFrame,
     x: str = None,
@@ -251,17 +461,33 @@ def plot_crosstab_as_barplot(
         cross_t = data
     else:
         # Create cross-tabulation
-        cross_t = pd.crosstab(data[x], data[y])
+        cross_t = (
+            data.groupby([x, y], observed=True, sort=False)
+            .size()
+            .unstack(y, fill_value=0)
+            .sort_index()
+            .sort_index(axis=1)
+        )
 
-    # Row percentage
+    # Percentages: normalize in place on a single float copy
     if normalize == "all":
-        cross_p = cross_t.div(cross_t.sum().sum()) * 100
+        axis = None
     elif normalize in ["row", "index", "x", 0]:
-        cross_p = cross_t.div(cross_t.sum(axis=1), axis=0) * 100
+        axis = 1
     elif normalize in ["column", "columns", "color", 1]:
-        cross_p = cross_t.div(cross_t.sum(axis=0), axis=1) * 100
+        axis = 0
     else:
+        axis = False
+
+    if axis is False:
         cross_p = cross_t
+    else:
+        arr = cross_t.to_numpy(dtype=float, copy=True)
+        np.divide(arr, arr.sum(axis=axis, keepdims=True), out=arr)
+        arr *= 100.0
+        cross_p = pd.DataFrame(
+            arr, index=cross_t.index, columns=cross_t.columns
+        )
 
     if (ylabel is None):
         if normalize is not None: